@@ -1,91 +1,124 @@
-import math
-import random
+from math import sqrt as _sqrt
 from typing import List, Tuple, Optional
 
+import numpy as np
+
+from logic_kernels import (build_grid_kernel, handle_collisions_kernel,
+                           handle_collisions_uniform_kernel,
+                           morton_codes_kernel, process_suction_kernel)
+
+
+# Физические параметры
+FRICTION = 0.98  # Коэффициент трения
+BOUNCE = 0.8  # Доля скорости, сохраняемая при отскоке от границы
+BALL_RADIUS = 15  # Радиус шарика по умолчанию
+
+# Начальная емкость массивов шариков (увеличивается вдвое при нехватке)
+INITIAL_CAPACITY = 64
+
+# Раз в столько кадров шарики упорядочиваются в массивах по Z-кривой
+SORT_INTERVAL = 30
+
+# Сколько наборов случайных параметров шарика генерируется за раз
+RANDOM_POOL_SIZE = 1024
+
+
+def pack_color(color: Tuple[int, int, int]) -> int:
+    """Упаковывает RGB цвет (r, g, b) в одно число 0x00RRGGBB."""
+    r, g, b = color
+    return (r << 16) | (g << 8) | b
+
+
+def unpack_color(packed: int) -> Tuple[int, int, int]:
+    """Распаковывает число 0x00RRGGBB в RGB цвет (r, g, b)."""
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
 
 class Ball:
-    """Класс для представления шарика в игре."""
+    """
+    Дескриптор шарика.
     
-    def __init__(self, x: float, y: float, radius: float = 15, 
-                 color: Tuple[int, int, int] = None, 
-                 velocity: Tuple[float, float] = None):
-        """
-        Инициализация шарика.
-        
-        Args:
-            x, y: Позиция шарика
-            radius: Радиус шарика
-            color: RGB цвет (r, g, b) от 0 до 255
-            velocity: Вектор скорости (vx, vy)
-        """
-        self.x = x
-        self.y = y
-        self.radius = radius
-        
-        # Случайный цвет, если не указан
-        if color is None:
-            self.color = (
-                random.randint(50, 255),
-                random.randint(50, 255),
-                random.randint(50, 255)
-            )
-        else:
-            self.color = color
-        
-        # Случайная скорость, если не указана
-        if velocity is None:
-            speed = random.uniform(1, 3)
-            angle = random.uniform(0, 2 * math.pi)
-            self.velocity = (speed * math.cos(angle), speed * math.sin(angle))
-        else:
-            self.velocity = velocity
+    Сами данные хранятся в параллельных массивах GameLogic (xs, ys, vxs,
+    vys, radii, colors), а Ball лишь ссылается на индекс в этих массивах.
+    Индекс действителен до следующего обновления игровой логики: при
+    удалении и упорядочивании шарики меняют свои места в массивах.
+    """
+    
+    __slots__ = ('logic', 'idx')
     
-    def update(self, screen_width: int, screen_height: int, 
-               friction: float = 0.98) -> None:
+    def __init__(self, logic: 'GameLogic', idx: int):
         """
-        Обновление позиции шарика с учетом границ экрана.
+        Инициализация дескриптора шарика.
         
         Args:
-            screen_width: Ширина экрана
-            screen_height: Высота экрана
-            friction: Коэффициент трения (по умолчанию 0.98)
+            logic: Игровая логика, хранящая данные шарика
+            idx: Индекс шарика в массивах игровой логики
         """
-        vx, vy = self.velocity
-        
-        # Применяем трение
-        vx *= friction
-        vy *= friction
-        
-        # Обновляем позицию
-        self.x += vx
-        self.y += vy
-        
-        # Отскок от границ (мягкий, чтобы не застревать)
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            vx = abs(vx) * 0.8
-        elif self.x + self.radius > screen_width:
-            self.x = screen_width - self.radius
-            vx = -abs(vx) * 0.8
-        
-        if self.y - self.radius < 0:
-            self.y = self.radius
-            vy = abs(vy) * 0.8
-        elif self.y + self.radius > screen_height:
-            self.y = screen_height - self.radius
-            vy = -abs(vy) * 0.8
-        
-        self.velocity = (vx, vy)
+        self.logic = logic
+        self.idx = idx
+    
+    @property
+    def x(self) -> float:
+        return float(self.logic.xs[self.idx])
+    
+    @x.setter
+    def x(self, value: float) -> None:
+        self.logic.xs[self.idx] = value
+    
+    @property
+    def y(self) -> float:
+        return float(self.logic.ys[self.idx])
+    
+    @y.setter
+    def y(self, value: float) -> None:
+        self.logic.ys[self.idx] = value
+    
+    @property
+    def radius(self) -> float:
+        return float(self.logic.radii[self.idx])
+    
+    @radius.setter
+    def radius(self, value: float) -> None:
+        if value != self.logic.uniform_radius:
+            self.logic.uniform_radius = None
+        self.logic.radii[self.idx] = value
+    
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return unpack_color(int(self.logic.colors[self.idx]))
+    
+    @color.setter
+    def color(self, value: Tuple[int, int, int]) -> None:
+        self.logic.colors[self.idx] = pack_color(value)
+    
+    @property
+    def vx(self) -> float:
+        return float(self.logic.vxs[self.idx])
+    
+    @vx.setter
+    def vx(self, value: float) -> None:
+        self.logic.vxs[self.idx] = value
+    
+    @property
+    def vy(self) -> float:
+        return float(self.logic.vys[self.idx])
+    
+    @vy.setter
+    def vy(self, value: float) -> None:
+        self.logic.vys[self.idx] = value
     
     def distance_to(self, other: 'Ball') -> float:
         """Вычисляет расстояние до другого шарика."""
         dx = self.x - other.x
         dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        return _sqrt(dx * dx + dy * dy)
     
     def is_colliding(self, other: 'Ball') -> bool:
         """Проверяет, касается ли шарик другого шарика."""
-        return self.distance_to(other) <= (self.radius + other.radius)
+        dx = self.x - other.x
+        dy = self.y - other.y
+        radius_sum = self.radius + other.radius
+        return dx * dx + dy * dy <= radius_sum * radius_sum
     
     def is_point_inside(self, x: float, y: float) -> bool:
         """Проверяет, находится ли точка внутри шарика."""
@@ -107,8 +140,34 @@ class GameLogic:
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.balls: List[Ball] = []
-        self.inventory: List[Ball] = []  # Инвентарь для всасывания шариков
+        
+        # Данные шариков на экране хранятся в параллельных массивах,
+        # живые шарики занимают индексы [0, n)
+        self.n = 0
+        self.xs = np.empty(INITIAL_CAPACITY, np.float32)
+        self.ys = np.empty(INITIAL_CAPACITY, np.float32)
+        self.vxs = np.empty(INITIAL_CAPACITY, np.float32)
+        self.vys = np.empty(INITIAL_CAPACITY, np.float32)
+        self.radii = np.empty(INITIAL_CAPACITY, np.float32)
+        self.colors = np.empty(INITIAL_CAPACITY, np.uint32)  # 0x00RRGGBB
+        
+        # Общий радиус всех шариков на экране или None, если радиусы
+        # различаются (тогда столкновения проверяются медленнее)
+        self.uniform_radius: Optional[float] = BALL_RADIUS
+        
+        # Номер кадра (для периодического упорядочивания шариков)
+        self.frame = 0
+        
+        # Случайные числа генерируются пачками: параметры для add_ball
+        # и eject_ball берутся из заранее заполненного пула
+        self.rng = np.random.default_rng()
+        self._random_pool: List[Tuple[float, float, int, float, float, float]] = []
+        
+        # Пул дескрипторов шариков (см. _handle)
+        self._pool: List[Ball] = []
+        
+        # Инвентарь для всасывания шариков: (радиус, упакованный цвет)
+        self.inventory: List[Tuple[float, int]] = []
         
         # Зона удаления (правый верхний угол, например)
         self.delete_zone_size = 100  # Размер зоны удаления
@@ -117,32 +176,182 @@ class GameLogic:
         
         # Параметры всасывания
         self.suction_range = 100  # Радиус всасывания
+        self.suction_range_sq = self.suction_range * self.suction_range
         self.suction_active = False
         self.suction_mouse_pos = (0, 0)
     
+    @property
+    def balls(self) -> List[Ball]:
+        """Дескрипторы всех шариков на экране."""
+        return [self._handle(i) for i in range(self.n)]
+    
+    def _handle(self, i: int) -> Ball:
+        """
+        Возвращает дескриптор шарика с индексом i.
+        
+        Дескрипторы не создаются заново при каждом добавлении шарика:
+        для каждого индекса в пуле хранится один Ball, который
+        переиспользуется всеми шариками, занимающими этот индекс.
+        """
+        pool = self._pool
+        while len(pool) <= i:
+            pool.append(Ball(self, len(pool)))
+        return pool[i]
+    
+    def _ensure_capacity(self, size: int) -> None:
+        """Увеличивает емкость массивов шариков, если она меньше size."""
+        capacity = len(self.xs)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ('xs', 'ys', 'vxs', 'vys', 'radii', 'colors'):
+            old = getattr(self, name)
+            new = np.empty(capacity, old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+    
+    def _track_radius(self, radius: float) -> None:
+        """Обновляет uniform_radius перед добавлением шарика радиуса radius."""
+        if self.n == 0:
+            self.uniform_radius = radius
+        elif radius != self.uniform_radius:
+            self.uniform_radius = None
+    
+    def _append(self, x: float, y: float, vx: float, vy: float,
+                radius: float, color: int) -> Ball:
+        """Записывает шарик в конец массивов и возвращает его дескриптор."""
+        self._ensure_capacity(self.n + 1)
+        self._track_radius(radius)
+        i = self.n
+        self.xs[i] = x
+        self.ys[i] = y
+        self.vxs[i] = vx
+        self.vys[i] = vy
+        self.radii[i] = radius
+        self.colors[i] = color
+        self.n = i + 1
+        return self._handle(i)
+    
+    def _remove_at(self, i: int) -> None:
+        """
+        Удаляет шарик с индексом i за O(1): на его место переносится
+        последний шарик. Порядок шариков при этом не сохраняется.
+        """
+        last = self.n - 1
+        if i != last:
+            self.xs[i] = self.xs[last]
+            self.ys[i] = self.ys[last]
+            self.vxs[i] = self.vxs[last]
+            self.vys[i] = self.vys[last]
+            self.radii[i] = self.radii[last]
+            self.colors[i] = self.colors[last]
+        self.n = last
+    
+    def _remove_indices(self, remove_idx: List[int]) -> None:
+        """
+        Удаляет шарики с указанными индексами за O(k), k = len(remove_idx).
+        
+        Args:
+            remove_idx: Индексы удаляемых шариков (без повторов)
+        """
+        # Удаляем с конца, чтобы перестановка с последним шариком
+        # не затрагивала еще не удаленные индексы
+        remove_idx.sort(reverse=True)
+        for i in remove_idx:
+            self._remove_at(i)
+    
     def add_ball(self, x: float = None, y: float = None, 
-                 color: Tuple[int, int, int] = None) -> Ball:
+                 color: Tuple[int, int, int] = None,
+                 radius: float = BALL_RADIUS) -> Ball:
         """
         Добавляет новый шарик на экран.
         
         Args:
             x, y: Позиция шарика (если None, случайная позиция)
             color: Цвет шарика (если None, случайный цвет)
+            radius: Радиус шарика
         """
+        random_x, random_y, random_color, dir_x, dir_y, u = self._next_random()
         if x is None:
-            x = random.uniform(50, self.screen_width - 50)
+            x = random_x
         if y is None:
-            y = random.uniform(50, self.screen_height - 50)
+            y = random_y
         
-        ball = Ball(x, y, color=color)
-        self.balls.append(ball)
-        return ball
+        # Случайный цвет, если не указан
+        if color is None:
+            color = random_color
+        else:
+            color = pack_color(color)
+        
+        # Случайная скорость от 1 до 3
+        speed = 1 + 2 * u
+        
+        return self._append(x, y, speed * dir_x, speed * dir_y, radius, color)
+    
+    def add_balls(self, count: int, radius: float = BALL_RADIUS) -> None:
+        """
+        Добавляет сразу count шариков со случайными позициями, цветами
+        и скоростями (одним вызовом генератора на каждый параметр).
+        
+        Args:
+            count: Количество шариков
+            radius: Радиус шариков
+        """
+        if count <= 0:
+            return
+        rng = self.rng
+        start, end = self.n, self.n + count
+        self._ensure_capacity(end)
+        self._track_radius(radius)
+        
+        speeds = rng.uniform(1, 3, count)
+        angles = rng.uniform(0, 2 * np.pi, count)
+        self.xs[start:end] = rng.uniform(50, self.screen_width - 50, count)
+        self.ys[start:end] = rng.uniform(50, self.screen_height - 50, count)
+        self.vxs[start:end] = speeds * np.cos(angles)
+        self.vys[start:end] = speeds * np.sin(angles)
+        self.radii[start:end] = radius
+        self.colors[start:end] = self._random_colors(count)
+        self.n = end
+    
+    def _random_colors(self, count: int) -> np.ndarray:
+        """Генерирует count случайных упакованных цветов (каналы 50..255)."""
+        rgb = self.rng.integers(50, 256, (count, 3), dtype=np.uint32)
+        return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    
+    def _next_random(self) -> Tuple[float, float, int, float, float, float]:
+        """
+        Берет из пула случайные параметры для одного шарика,
+        при необходимости заполняя пул заново.
+        
+        Returns:
+            (x, y, цвет, dir_x, dir_y, u): позиция, упакованный цвет,
+            единичный вектор направления и число u из [0, 1) для скорости
+        """
+        if not self._random_pool:
+            rng = self.rng
+            size = RANDOM_POOL_SIZE
+            angles = rng.uniform(0, 2 * np.pi, size)
+            self._random_pool = list(zip(
+                rng.uniform(50, self.screen_width - 50, size).tolist(),
+                rng.uniform(50, self.screen_height - 50, size).tolist(),
+                self._random_colors(size).tolist(),
+                np.cos(angles).tolist(),
+                np.sin(angles).tolist(),
+                rng.random(size).tolist()))
+        return self._random_pool.pop()
     
     def update(self) -> None:
         """Обновляет всю игровую логику за один кадр."""
+        # Время от времени упорядочиваем шарики, чтобы соседние на экране
+        # лежали рядом в памяти
+        self.frame += 1
+        if self.frame % SORT_INTERVAL == 0:
+            self._sort_by_cell()
+        
         # Обновляем позиции всех шариков
-        for ball in self.balls:
-            ball.update(self.screen_width, self.screen_height)
+        self._move_balls()
         
         # Проверяем столкновения и смешиваем цвета
         self._handle_collisions()
@@ -154,58 +363,96 @@ class GameLogic:
         # Проверяем зону удаления
         self._check_delete_zone()
     
-    def _handle_collisions(self) -> None:
-        """Обрабатывает столкновения шариков и смешивает их цвета."""
-        checked_pairs = set()
-        
-        for i, ball1 in enumerate(self.balls):
-            for j, ball2 in enumerate(self.balls[i + 1:], start=i + 1):
-                # Избегаем повторной проверки
-                pair = (min(i, j), max(i, j))
-                if pair in checked_pairs:
-                    continue
-                checked_pairs.add(pair)
-                
-                if ball1.is_colliding(ball2):
-                    # Смешиваем цвета
-                    self._mix_colors(ball1, ball2)
-    
-    def _mix_colors(self, ball1: Ball, ball2: Ball) -> None:
+    def _move_balls(self) -> None:
+        """Перемещает все шарики с учетом трения и границ экрана."""
+        n = self.n
+        xs, ys = self.xs[:n], self.ys[:n]
+        vxs, vys = self.vxs[:n], self.vys[:n]
+        radii = self.radii[:n]
+        
+        # Применяем трение
+        vxs *= FRICTION
+        vys *= FRICTION
+        
+        # Обновляем позицию
+        xs += vxs
+        ys += vys
+        
+        # Отскок от границ (мягкий, чтобы не застревать)
+        left = xs - radii < 0
+        xs[left] = radii[left]
+        vxs[left] = np.abs(vxs[left]) * BOUNCE
+        
+        right = xs + radii > self.screen_width
+        xs[right] = self.screen_width - radii[right]
+        vxs[right] = -np.abs(vxs[right]) * BOUNCE
+        
+        top = ys - radii < 0
+        ys[top] = radii[top]
+        vys[top] = np.abs(vys[top]) * BOUNCE
+        
+        bottom = ys + radii > self.screen_height
+        ys[bottom] = self.screen_height - radii[bottom]
+        vys[bottom] = -np.abs(vys[bottom]) * BOUNCE
+    
+    def _grid_shape(self) -> Tuple[float, int, int]:
         """
-        Смешивает цвета двух шариков при касании.
-        Использует интересный алгоритм смешивания, избегая белого цвета.
+        Возвращает сторону ячейки и размеры сетки (cell, gw, gh).
         
-        Args:
-            ball1, ball2: Шарики для смешивания цветов
+        Сторона ячейки равна диаметру самого большого шарика,
+        так что касающиеся шарики всегда лежат в соседних ячейках.
         """
-        r1, g1, b1 = ball1.color
-        r2, g2, b2 = ball2.color
-        
-        # Используем нелинейное смешивание для более интересных результатов
-        # Среднее значение с небольшим смещением
-        mixed_r = int((r1 * 0.6 + r2 * 0.4) % 255)
-        mixed_g = int((g1 * 0.6 + g2 * 0.4) % 255)
-        mixed_b = int((b1 * 0.6 + b2 * 0.4) % 255)
-        
-        # Проверяем, не слишком ли светлый цвет (близок к белому)
-        brightness = (mixed_r + mixed_g + mixed_b) / 3
-        
-        # Если цвет слишком светлый (близок к белому), делаем его более насыщенным
-        if brightness > 200:
-            # Усиливаем один из каналов для создания более интересного цвета
-            if mixed_r > mixed_g and mixed_r > mixed_b:
-                mixed_g = max(50, mixed_g - 50)
-                mixed_b = max(50, mixed_b - 50)
-            elif mixed_g > mixed_r and mixed_g > mixed_b:
-                mixed_r = max(50, mixed_r - 50)
-                mixed_b = max(50, mixed_b - 50)
-            else:
-                mixed_r = max(50, mixed_r - 50)
-                mixed_g = max(50, mixed_g - 50)
-        
-        # Применяем новый цвет к обоим шарикам
-        ball1.color = (mixed_r, mixed_g, mixed_b)
-        ball2.color = (mixed_r, mixed_g, mixed_b)
+        if self.uniform_radius is not None:
+            cell = 2 * float(self.uniform_radius)
+        else:
+            cell = 2 * float(self.radii[:self.n].max())
+        gw = int(self.screen_width // cell) + 1
+        gh = int(self.screen_height // cell) + 1
+        return cell, gw, gh
+    
+    def _sort_by_cell(self) -> None:
+        """
+        Переставляет шарики в массивах в порядке Z-кривой (кода Мортона)
+        их ячеек сетки, чтобы обход соседних ячеек при столкновениях
+        читал память почти последовательно.
+        """
+        n = self.n
+        if n < 2:
+            return
+        
+        cell, gw, gh = self._grid_shape()
+        codes = np.empty(n, np.uint32)
+        morton_codes_kernel(self.xs[:n], self.ys[:n], cell, gw, gh, codes)
+        order = np.argsort(codes, kind='stable')
+        
+        # Шарики движутся медленно, и порядок часто уже правильный
+        if np.array_equal(order, np.arange(n)):
+            return
+        for name in ('xs', 'ys', 'vxs', 'vys', 'radii', 'colors'):
+            arr = getattr(self, name)
+            arr[:n] = arr[:n][order]
+    
+    def _handle_collisions(self) -> None:
+        """Обрабатывает столкновения шариков: отскок и смешивание цветов."""
+        n = self.n
+        if n < 2:
+            return
+        
+        uniform_radius = self.uniform_radius
+        cell, gw, gh = self._grid_shape()
+        head = np.empty(gw * gh, np.int32)
+        nxt = np.empty(n, np.int32)
+        
+        xs, ys = self.xs[:n], self.ys[:n]
+        build_grid_kernel(xs, ys, cell, gw, gh, head, nxt)
+        if uniform_radius is not None:
+            handle_collisions_uniform_kernel(
+                xs, ys, self.vxs[:n], self.vys[:n], float(uniform_radius),
+                self.colors[:n], head, nxt, cell, gw, gh)
+        else:
+            handle_collisions_kernel(
+                xs, ys, self.vxs[:n], self.vys[:n], self.radii[:n],
+                self.colors[:n], head, nxt, cell, gw, gh)
     
     def start_suction(self, mouse_x: float, mouse_y: float) -> None:
         """
@@ -224,52 +471,30 @@ class GameLogic:
     def _process_suction(self) -> None:
         """Обрабатывает всасывание шариков в инвентарь."""
         mouse_x, mouse_y = self.suction_mouse_pos
-        balls_to_remove = []
-        
-        for ball in self.balls:
-            # Проверяем, находится ли шарик в радиусе всасывания
-            dx = ball.x - mouse_x
-            dy = ball.y - mouse_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance <= self.suction_range:
-                # Притягиваем шарик к мыши
-                pull_strength = (self.suction_range - distance) / self.suction_range
-                pull_strength = min(pull_strength * 5, 10)  # Ограничиваем силу
-                
-                # Вычисляем направление
-                if distance > 0:
-                    dir_x = dx / distance
-                    dir_y = dy / distance
-                else:
-                    dir_x = 0
-                    dir_y = 0
-                
-                # Применяем притяжение
-                vx, vy = ball.velocity
-                ball.velocity = (
-                    vx + dir_x * pull_strength * 0.3,
-                    vy + dir_y * pull_strength * 0.3
-                )
-                
-                # Если шарик очень близко к мыши, добавляем в инвентарь
-                if distance < ball.radius + 10:
-                    self.inventory.append(ball)
-                    balls_to_remove.append(ball)
-        
-        # Удаляем шарики, попавшие в инвентарь
-        for ball in balls_to_remove:
-            if ball in self.balls:
-                self.balls.remove(ball)
+        n = self.n
+        
+        captured = np.empty(n, np.int32)
+        count = process_suction_kernel(
+            self.xs[:n], self.ys[:n], self.vxs[:n], self.vys[:n],
+            self.radii[:n], float(mouse_x), float(mouse_y),
+            float(self.suction_range), float(self.suction_range_sq), captured)
+        if count == 0:
+            return
+        
+        # Шарики очень близко к мыши переносим в инвентарь
+        captured = captured[:count]
+        self.inventory.extend(zip(self.radii[captured].tolist(),
+                                  self.colors[captured].tolist()))
+        self._remove_indices(captured.tolist())
     
     def eject_ball(self, mouse_x: float, mouse_y: float, 
-                   velocity: Tuple[float, float] = None) -> Optional[Ball]:
+                   vx: float = None, vy: float = None) -> Optional[Ball]:
         """
         Выплевывает шарик из инвентаря обратно на экран.
         
         Args:
             mouse_x, mouse_y: Позиция мыши (куда выплюнуть)
-            velocity: Начальная скорость шарика (если None, случайная)
+            vx, vy: Начальная скорость шарика (если None, случайная)
         
         Returns:
             Выплюнутый шарик или None, если инвентарь пуст
@@ -278,37 +503,33 @@ class GameLogic:
             return None
         
         # Берем последний шарик из инвентаря
-        ball = self.inventory.pop()
-        
-        # Устанавливаем позицию
-        ball.x = mouse_x
-        ball.y = mouse_y
+        radius, color = self.inventory.pop()
         
         # Устанавливаем скорость
-        if velocity is None:
-            speed = random.uniform(2, 5)
-            angle = random.uniform(0, 2 * math.pi)
-            ball.velocity = (speed * math.cos(angle), speed * math.sin(angle))
-        else:
-            ball.velocity = velocity
+        if vx is None or vy is None:
+            _, _, _, dir_x, dir_y, u = self._next_random()
+            speed = 2 + 3 * u  # Случайная скорость от 2 до 5
+            if vx is None:
+                vx = speed * dir_x
+            if vy is None:
+                vy = speed * dir_y
         
         # Добавляем обратно на экран
-        self.balls.append(ball)
-        return ball
+        return self._append(mouse_x, mouse_y, vx, vy, radius, color)
     
     def _check_delete_zone(self) -> None:
         """Проверяет, находятся ли шарики в зоне удаления, и удаляет их."""
-        balls_to_remove = []
+        n = self.n
         
-        for ball in self.balls:
-            # Проверяем, находится ли шарик в зоне удаления
-            if (self.delete_zone_x <= ball.x <= self.screen_width and
-                0 <= ball.y <= self.delete_zone_size):
-                balls_to_remove.append(ball)
+        # Проверяем все шарики одной маской. Правая и нижняя границы зоны
+        # не проверяются: _move_balls уже удержал шарики в пределах экрана.
+        in_zone = ((self.xs[:n] >= self.delete_zone_x) &
+                   (self.ys[:n] <= self.delete_zone_y + self.delete_zone_size))
+        remove_idx = np.nonzero(in_zone)[0].tolist()
         
         # Удаляем шарики
-        for ball in balls_to_remove:
-            self.balls.remove(ball)
+        if remove_idx:
+            self._remove_indices(remove_idx)
     
     def is_in_delete_zone(self, x: float, y: float) -> bool:
         """
@@ -333,10 +554,13 @@ class GameLogic:
         Returns:
             Шарик или None
         """
-        for ball in self.balls:
-            if ball.is_point_inside(x, y):
-                return ball
-        return None
+        n = self.n
+        dx = x - self.xs[:n]
+        dy = y - self.ys[:n]
+        inside = np.nonzero(dx * dx + dy * dy <= self.radii[:n] ** 2)[0]
+        if len(inside) == 0:
+            return None
+        return self._handle(int(inside[0]))
     
     def get_delete_zone_bounds(self) -> Tuple[int, int, int, int]:
         """
@@ -347,4 +571,3 @@ class GameLogic:
         """
         return (self.delete_zone_x, self.delete_zone_y, 
                 self.delete_zone_size, self.delete_zone_size)
-
@@ -0,0 +1,257 @@
+# sqrt импортируется как имя модуля, а не math.sqrt: без numba это
+# экономит поиск атрибута на каждый вызов в горячих циклах
+from math import sqrt as _sqrt
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Без numba ядра выполняются как обычные функции Python
+    def njit(*args, **kwargs):
+        """Заглушка numba.njit, возвращающая функцию без изменений."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Ядра работают только с массивами и числами (numba не видит объекты Ball):
+# xs, ys, vxs, vys, radii - float32[n], colors - uint32[n] (0x00RRGGBB),
+# сетка - int32.
+
+
+@njit(cache=True, fastmath=True)
+def build_grid_kernel(xs, ys, cell, gw, gh, head, nxt):
+    """
+    Раскладывает шарики по ячейкам равномерной сетки.
+
+    Args:
+        xs, ys: Координаты шариков
+        cell: Сторона ячейки
+        gw, gh: Размеры сетки в ячейках
+        head: Выход, первый шарик каждой ячейки (-1, если ячейка пуста)
+        nxt: Выход, следующий шарик той же ячейки (-1 - конец списка)
+    """
+    head[:] = -1
+    for i in range(xs.shape[0]):
+        cx = min(max(int(xs[i] // cell), 0), gw - 1)
+        cy = min(max(int(ys[i] // cell), 0), gh - 1)
+        c = cy * gw + cx
+        nxt[i] = head[c]
+        head[c] = i
+
+
+@njit(cache=True, fastmath=True)
+def morton_codes_kernel(xs, ys, cell, gw, gh, codes):
+    """
+    Вычисляет код Мортона (Z-порядок) ячейки сетки каждого шарика:
+    биты номеров столбца и строки чередуются, поэтому близкие ячейки
+    получают близкие коды.
+
+    Args:
+        xs, ys: Координаты шариков
+        cell: Сторона ячейки
+        gw, gh: Размеры сетки в ячейках
+        codes: Выход, коды шариков (uint32)
+    """
+    for i in range(xs.shape[0]):
+        cx = min(max(int(xs[i] // cell), 0), gw - 1)
+        cy = min(max(int(ys[i] // cell), 0), gh - 1)
+        code = 0
+        for bit in range(16):
+            code |= ((cx >> bit) & 1) << (2 * bit)
+            code |= ((cy >> bit) & 1) << (2 * bit + 1)
+        codes[i] = code
+
+
+@njit(cache=True, fastmath=True)
+def mix_colors_kernel(c1, c2):
+    """
+    Смешивает два упакованных цвета 0x00RRGGBB без ветвлений.
+    Использует интересный алгоритм смешивания, избегая белого цвета.
+
+    Returns:
+        Упакованный смешанный цвет
+    """
+    # Все три канала смешиваются сразу (5/8 первого цвета + 3/8 второго):
+    # маски после сдвигов не дают битам перетечь в соседний канал,
+    # а сумма не превышает 252, так что переноса между каналами нет
+    mixed = (((c1 >> 1) & 0x7F7F7F) + ((c1 >> 3) & 0x1F1F1F) +
+             ((c2 >> 2) & 0x3F3F3F) + ((c2 >> 3) & 0x1F1F1F))
+    r = (mixed >> 16) & 0xFF
+    g = (mixed >> 8) & 0xFF
+    b = mixed & 0xFF
+
+    # Если цвет слишком светлый (близок к белому), делаем его более
+    # насыщенным: уменьшаем на 50 все каналы, кроме преобладающего.
+    # Яркий цвет имеет каждый канал больше 90, поэтому вычитание
+    # не уходит в соседний канал.
+    bright = int(r + g + b > 600)
+    r_dom = int(r > g) & int(r > b)
+    g_dom = int(g > r) & int(g > b)
+    b_dom = 1 - r_dom - g_dom
+    keep = (r_dom << 16) | (g_dom << 8) | b_dom
+    return mixed - (0x010101 - keep) * 50 * bright
+
+
+@njit(cache=True, fastmath=True)
+def resolve_contact_kernel(xs, ys, vxs, vys, colors, i, j, dx, dy, d2,
+                           radius_sum):
+    """
+    Расталкивает касающиеся шарики i и j и смешивает их цвета.
+
+    Перекрывающиеся шарики раздвигаются вдоль линии центров. Если они
+    сближаются, нормальные составляющие скоростей обмениваются (упругий
+    удар равных масс) и цвета смешиваются - то есть один раз на касание,
+    а не каждый кадр, пока шарики соприкасаются.
+
+    Args:
+        dx, dy, d2: Вектор от центра i к центру j и квадрат его длины
+        radius_sum: Сумма радиусов шариков
+    """
+    # Корень берем только для касающихся пар
+    distance = _sqrt(d2)
+
+    # Нормаль от i к j (для совпавших центров - любая)
+    if distance > 0:
+        nx = dx / distance
+        ny = dy / distance
+    else:
+        nx = 1.0
+        ny = 0.0
+
+    # Раздвигаем шарики поровну
+    overlap = (radius_sum - distance) * 0.5
+    xs[i] -= nx * overlap
+    ys[i] -= ny * overlap
+    xs[j] += nx * overlap
+    ys[j] += ny * overlap
+
+    # Скорость сближения вдоль нормали
+    p = (vxs[i] - vxs[j]) * nx + (vys[i] - vys[j]) * ny
+    if p > 0:
+        vxs[i] -= p * nx
+        vys[i] -= p * ny
+        vxs[j] += p * nx
+        vys[j] += p * ny
+
+        mixed = mix_colors_kernel(colors[i], colors[j])
+        colors[i] = mixed
+        colors[j] = mixed
+
+
+@njit(cache=True, fastmath=True)
+def handle_collisions_kernel(xs, ys, vxs, vys, radii, colors, head, nxt,
+                             cell, gw, gh):
+    """
+    Находит касающиеся шарики по сетке и обрабатывает их столкновения.
+
+    Каждый шарик проверяется только с шариками из той же и 8 соседних
+    ячеек; каждая пара проверяется один раз благодаря j > i.
+    """
+    for i in range(xs.shape[0]):
+        cx = min(max(int(xs[i] // cell), 0), gw - 1)
+        cy = min(max(int(ys[i] // cell), 0), gh - 1)
+        for gy in range(max(cy - 1, 0), min(cy + 2, gh)):
+            for gx in range(max(cx - 1, 0), min(cx + 2, gw)):
+                j = head[gy * gw + gx]
+                while j != -1:
+                    if j > i:
+                        dx = xs[j] - xs[i]
+                        dy = ys[j] - ys[i]
+                        d2 = dx * dx + dy * dy
+                        radius_sum = radii[i] + radii[j]
+                        if d2 <= radius_sum * radius_sum:
+                            resolve_contact_kernel(xs, ys, vxs, vys, colors,
+                                                   i, j, dx, dy, d2, radius_sum)
+                    j = nxt[j]
+
+
+@njit(cache=True, fastmath=True)
+def handle_collisions_uniform_kernel(xs, ys, vxs, vys, radius, colors, head,
+                                     nxt, cell, gw, gh):
+    """
+    То же, что handle_collisions_kernel, для шариков одного радиуса radius:
+    порог касания считается один раз, а массив радиусов не читается.
+    """
+    diameter = 2 * radius
+    diameter_sq = diameter * diameter
+    for i in range(xs.shape[0]):
+        cx = min(max(int(xs[i] // cell), 0), gw - 1)
+        cy = min(max(int(ys[i] // cell), 0), gh - 1)
+        for gy in range(max(cy - 1, 0), min(cy + 2, gh)):
+            for gx in range(max(cx - 1, 0), min(cx + 2, gw)):
+                j = head[gy * gw + gx]
+                while j != -1:
+                    if j > i:
+                        dx = xs[j] - xs[i]
+                        dy = ys[j] - ys[i]
+                        d2 = dx * dx + dy * dy
+                        if d2 <= diameter_sq:
+                            resolve_contact_kernel(xs, ys, vxs, vys, colors,
+                                                   i, j, dx, dy, d2, diameter)
+                    j = nxt[j]
+
+
+@njit(cache=True, fastmath=True)
+def process_suction_kernel(xs, ys, vxs, vys, radii, mouse_x, mouse_y,
+                           suction_range, suction_range_sq, captured):
+    """
+    Притягивает шарики в радиусе всасывания и отбирает пойманные.
+
+    Args:
+        mouse_x, mouse_y: Позиция мыши
+        suction_range: Радиус всасывания
+        suction_range_sq: Квадрат радиуса всасывания
+        captured: Выход, индексы пойманных шариков по возрастанию
+
+    Returns:
+        Количество пойманных шариков (заполненная часть captured)
+    """
+    count = 0
+    for i in range(xs.shape[0]):
+        # Проверяем, находится ли шарик в радиусе всасывания
+        dx = xs[i] - mouse_x
+        dy = ys[i] - mouse_y
+        d2 = dx * dx + dy * dy
+
+        # Корень берем только для шариков в радиусе всасывания
+        if d2 <= suction_range_sq:
+            distance = _sqrt(d2)
+
+            # Притягиваем шарик к мыши
+            pull_strength = (suction_range - distance) / suction_range
+            pull_strength = min(pull_strength * 5, 10)  # Ограничиваем силу
+
+            # Применяем притяжение
+            if distance > 0:
+                vxs[i] += dx / distance * pull_strength * 0.3
+                vys[i] += dy / distance * pull_strength * 0.3
+
+            # Если шарик очень близко к мыши, добавляем в инвентарь
+            if distance < radii[i] + 10:
+                captured[count] = i
+                count += 1
+    return count
+
+
+def _warm_up() -> None:
+    """
+    Вызывает ядра на одном шарике, чтобы компиляция (или загрузка
+    из кэша) произошла при импорте, а не в первом кадре игры.
+    """
+    xs = np.zeros(1, np.float32)
+    colors = np.zeros(1, np.uint32)
+    head = np.empty(1, np.int32)
+    nxt = np.empty(1, np.int32)
+    build_grid_kernel(xs, xs, 1.0, 1, 1, head, nxt)
+    morton_codes_kernel(xs, xs, 1.0, 1, 1, np.empty(1, np.uint32))
+    handle_collisions_kernel(xs, xs, xs.copy(), xs.copy(), xs, colors,
+                             head, nxt, 1.0, 1, 1)
+    handle_collisions_uniform_kernel(xs, xs, xs.copy(), xs.copy(), 1.0, colors,
+                                     head, nxt, 1.0, 1, 1)
+    process_suction_kernel(xs, xs, xs.copy(), xs.copy(), xs, 0.0, 0.0, 1.0,
+                           1.0, np.empty(1, np.int32))
+
+
+_warm_up()
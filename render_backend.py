@@ -0,0 +1,437 @@
+import tkinter as tk
+from functools import lru_cache
+from tkinter import Canvas
+from types import SimpleNamespace
+
+import numpy as np
+
+from logic import GameLogic, unpack_color
+
+# Цвета (RGB в формате для tkinter: "#RRGGBB")
+WHITE = "#FFFFFF"
+BLACK = "#000000"
+RED = "#FF0000"
+GRAY = "#C8C8C8"
+DARK_GRAY = "#969696"
+DELETE_ZONE_COLOR = "#FFC8C8"
+SUCTION_COLOR = "#6496FF"
+SUCTION_CENTER_COLOR = "#96C8FF"
+
+WINDOW_TITLE = "Игра с шариками"
+INSTRUCTIONS = "ЛКМ: всасывать | ПКМ: выброс | Пробел: добавить"
+
+
+def hex_to_rgb(color: str):
+    """Конвертирует hex строку "#RRGGBB" в RGB кортеж."""
+    return unpack_color(int(color[1:], 16))
+
+
+# После столкновений цвета шариков быстро выравниваются и повторяются,
+# поэтому преобразования упакованного цвета кэшируются
+
+
+@lru_cache(maxsize=4096)
+def _hex_color(packed: int) -> str:
+    """Конвертирует упакованный цвет 0x00RRGGBB в hex строку для tkinter."""
+    return f"#{packed:06x}"
+
+
+@lru_cache(maxsize=4096)
+def _rgb_color(packed: int):
+    """Конвертирует упакованный цвет 0x00RRGGBB в RGB кортеж для pyglet."""
+    return unpack_color(packed)
+
+
+class RenderBackend:
+    """
+    Базовый класс способа отрисовки игры.
+
+    Бэкенд владеет окном: рисует состояние игровой логики, передает
+    события ввода обработчикам окна игры и планирует вызовы игрового цикла.
+    Координаты в событиях всегда экранные: (0, 0) - левый верхний угол.
+    """
+
+    def __init__(self, game: GameLogic):
+        """
+        Инициализация бэкенда.
+
+        Args:
+            game: Игровая логика, состояние которой рисуется
+        """
+        self.game = game
+
+    def bind(self, window) -> None:
+        """
+        Привязывает события ввода к обработчикам окна игры.
+
+        Args:
+            window: Объект с методами on_mouse_down, on_mouse_up,
+                on_mouse_move, on_right_click и on_space_press
+        """
+        raise NotImplementedError
+
+    def after(self, ms: int, callback) -> None:
+        """Планирует вызов callback() через ms миллисекунд."""
+        raise NotImplementedError
+
+    def draw(self) -> None:
+        """Отображает текущее состояние игровой логики."""
+        raise NotImplementedError
+
+    def run(self) -> None:
+        """Запускает главный цикл окна."""
+        raise NotImplementedError
+
+
+class TkBackend(RenderBackend):
+    """Отрисовка на tkinter Canvas с переиспользованием элементов."""
+
+    def __init__(self, game: GameLogic):
+        super().__init__(game)
+        self.root = tk.Tk()
+        self.root.title(WINDOW_TITLE)
+        self.root.geometry(f"{game.screen_width}x{game.screen_height}")
+        self.root.resizable(False, False)
+
+        # Создаем canvas для рисования
+        self.canvas = Canvas(self.root, width=game.screen_width,
+                             height=game.screen_height,
+                             bg=WHITE, highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        # Элементы canvas создаются один раз и затем только изменяются
+        self._create_static_items()
+
+        # Овал каждого шарика на экране (по индексу шарика в игровой логике)
+        # и то, что уже нарисовано: прямоугольник овала и упакованный цвет
+        self.ball_items = []
+        self.drawn_rects = np.empty((0, 4), np.int32)
+        self.drawn_colors = np.empty(0, np.int64)
+
+        # Последнее отображенное состояние всасывания и счетчиков
+        self.drawn_suction = None
+        self.drawn_counts = None
+
+    def bind(self, window) -> None:
+        self.canvas.bind("<Button-1>", window.on_mouse_down)
+        self.canvas.bind("<ButtonRelease-1>", window.on_mouse_up)
+        self.canvas.bind("<Button-3>", window.on_right_click)
+        self.canvas.bind("<Motion>", window.on_mouse_move)
+        self.canvas.bind("<ButtonPress-1>", window.on_mouse_down)
+        self.root.bind("<KeyPress-space>", window.on_space_press)
+        self.canvas.focus_set()
+
+    def after(self, ms: int, callback) -> None:
+        self.root.after(ms, callback)
+
+    def run(self) -> None:
+        self.root.mainloop()
+
+    def _create_static_items(self):
+        """Создает элементы canvas, которые живут все время игры."""
+        # Рисуем зону удаления
+        delete_zone = self.game.get_delete_zone_bounds()
+        delete_x, delete_y, delete_width, delete_height = delete_zone
+        self.canvas.create_rectangle(delete_x, delete_y,
+                                    delete_x + delete_width,
+                                    delete_y + delete_height,
+                                    fill=DELETE_ZONE_COLOR, outline=RED, width=2)
+
+        # Текст в зоне удаления
+        self.canvas.create_text(delete_x + delete_width // 2,
+                               delete_y + delete_height // 2,
+                               text="Удалить", fill=BLACK,
+                               font=("Arial", 12, "bold"))
+
+        # Элементы поверх шариков помечены тегом "overlay"
+        # Круг всасывания и индикатор его центра (скрыты, пока нет всасывания)
+        self.suction_ring = self.canvas.create_oval(
+            0, 0, 0, 0, outline=SUCTION_COLOR, width=2,
+            state=tk.HIDDEN, tags="overlay")
+        self.suction_center = self.canvas.create_oval(
+            0, 0, 0, 0, fill=SUCTION_CENTER_COLOR, outline=SUCTION_COLOR,
+            width=1, state=tk.HIDDEN, tags="overlay")
+
+        # Количество шариков в инвентаре и на экране
+        self.inventory_text = self.canvas.create_text(
+            10, 15, anchor=tk.W, fill=BLACK, font=("Arial", 12),
+            state=tk.HIDDEN, tags="overlay")
+        self.balls_text = self.canvas.create_text(
+            10, 40, anchor=tk.W, fill=BLACK, font=("Arial", 12),
+            tags="overlay")
+
+        # Инструкция
+        self.canvas.create_text(10, self.game.screen_height - 20, anchor=tk.W,
+                               text=INSTRUCTIONS,
+                               fill=DARK_GRAY, font=("Arial", 10),
+                               tags="overlay")
+
+    def draw(self) -> None:
+        # Перерисовываем только то, что изменилось с прошлого кадра
+        self._draw_balls()
+        self._draw_suction()
+        self._draw_counters()
+
+    def _draw_balls(self):
+        """Приводит овалы шариков на canvas в соответствие с игровой логикой."""
+        n = self.game.n
+        items = self.ball_items
+
+        # Создаем недостающие овалы и удаляем лишние
+        if len(items) < n:
+            for _ in range(n - len(items)):
+                items.append(self.canvas.create_oval(0, 0, 0, 0,
+                                                     outline=BLACK, width=1))
+            self.canvas.tag_raise("overlay")
+
+            # Новые овалы еще ничего не отображают
+            grow = n - len(self.drawn_colors)
+            self.drawn_rects = np.concatenate(
+                (self.drawn_rects, np.full((grow, 4), -1, np.int32)))
+            self.drawn_colors = np.concatenate(
+                (self.drawn_colors, np.full(grow, -1, np.int64)))
+        elif len(items) > n:
+            self.canvas.delete(*items[n:])
+            del items[n:]
+            self.drawn_rects = self.drawn_rects[:n]
+            self.drawn_colors = self.drawn_colors[:n]
+
+        # Двигаем только шарики, чей прямоугольник сместился хотя бы на пиксель
+        x = self.game.xs[:n].astype(np.int32)
+        y = self.game.ys[:n].astype(np.int32)
+        radius = self.game.radii[:n].astype(np.int32)
+        rects = np.stack((x - radius, y - radius, x + radius, y + radius),
+                         axis=1)
+        moved = np.nonzero((rects != self.drawn_rects).any(axis=1))[0]
+        for i, rect in zip(moved.tolist(), rects[moved].tolist()):
+            self.canvas.coords(items[i], *rect)
+        self.drawn_rects = rects
+
+        # Перекрашиваем только шарики, чей цвет изменился
+        # (цвета хранятся упакованными в 0x00RRGGBB)
+        colors = self.game.colors[:n]
+        recolored = np.nonzero(colors != self.drawn_colors)[0]
+        for i, packed in zip(recolored.tolist(), colors[recolored].tolist()):
+            self.canvas.itemconfig(items[i], fill=_hex_color(packed))
+        self.drawn_colors[recolored] = colors[recolored]
+
+    def _draw_suction(self):
+        """Показывает, прячет или перемещает визуализацию всасывания."""
+        if self.game.suction_active:
+            suction = self.game.suction_mouse_pos
+        else:
+            suction = None
+        if suction == self.drawn_suction:
+            return
+
+        if suction is None:
+            self.canvas.itemconfig(self.suction_ring, state=tk.HIDDEN)
+            self.canvas.itemconfig(self.suction_center, state=tk.HIDDEN)
+        else:
+            mx, my = int(suction[0]), int(suction[1])
+            range_radius = self.game.suction_range
+            self.canvas.coords(self.suction_ring,
+                               mx - range_radius, my - range_radius,
+                               mx + range_radius, my + range_radius)
+            self.canvas.coords(self.suction_center, mx - 5, my - 5, mx + 5, my + 5)
+            if self.drawn_suction is None:
+                self.canvas.itemconfig(self.suction_ring, state=tk.NORMAL)
+                self.canvas.itemconfig(self.suction_center, state=tk.NORMAL)
+        self.drawn_suction = suction
+
+    def _draw_counters(self):
+        """Обновляет счетчики шариков в инвентаре и на экране."""
+        counts = (len(self.game.inventory), self.game.n)
+        if counts == self.drawn_counts:
+            return
+
+        inventory_count, balls_count = counts
+        if inventory_count:
+            self.canvas.itemconfig(self.inventory_text, state=tk.NORMAL,
+                                   text=f"Инвентарь: {inventory_count}")
+        else:
+            self.canvas.itemconfig(self.inventory_text, state=tk.HIDDEN)
+        self.canvas.itemconfig(self.balls_text, text=f"Шариков: {balls_count}")
+        self.drawn_counts = counts
+
+
+class PygletBackend(RenderBackend):
+    """
+    Отрисовка через pyglet: все фигуры лежат в одном pyglet.graphics.Batch
+    и выводятся одним вызовом batch.draw() за кадр.
+
+    Требует установленного pyglet (pip install pyglet).
+    """
+
+    def __init__(self, game: GameLogic):
+        super().__init__(game)
+        # pyglet необязателен, поэтому импортируется только здесь
+        import pyglet
+        self.pyglet = pyglet
+
+        self.window = pyglet.window.Window(game.screen_width, game.screen_height,
+                                           caption=WINDOW_TITLE)
+        pyglet.gl.glClearColor(1, 1, 1, 1)
+        self.batch = pyglet.graphics.Batch()
+
+        # Порядок слоев: зона удаления, контуры шариков, шарики, все остальное
+        self.background = pyglet.graphics.Group(order=0)
+        self.outlines = pyglet.graphics.Group(order=1)
+        self.fills = pyglet.graphics.Group(order=2)
+        self.overlay = pyglet.graphics.Group(order=3)
+
+        self._create_static_items()
+
+        # Фигуры шариков (по индексу шарика в игровой логике): черный круг
+        # на единицу больше под цветным кругом. Ссылки держим здесь, иначе
+        # сборщик мусора удалит фигуры из batch.
+        self.shapes = []
+        self.drawn_colors = np.empty(0, np.int64)
+
+        @self.window.event
+        def on_draw():
+            self.window.clear()
+            self.batch.draw()
+
+    def _y(self, y: float) -> float:
+        """Переводит экранную y (сверху вниз) в координату pyglet (снизу вверх)."""
+        return self.game.screen_height - y
+
+    def _event(self, x: float, y: float) -> SimpleNamespace:
+        """Событие ввода с экранными координатами, как в tkinter."""
+        return SimpleNamespace(x=x, y=self._y(y))
+
+    def bind(self, window) -> None:
+        mouse = self.pyglet.window.mouse
+        key = self.pyglet.window.key
+
+        @self.window.event
+        def on_mouse_press(x, y, button, modifiers):
+            if button == mouse.LEFT:
+                window.on_mouse_down(self._event(x, y))
+            elif button == mouse.RIGHT:
+                window.on_right_click(self._event(x, y))
+
+        @self.window.event
+        def on_mouse_release(x, y, button, modifiers):
+            if button == mouse.LEFT:
+                window.on_mouse_up(self._event(x, y))
+
+        @self.window.event
+        def on_mouse_motion(x, y, dx, dy):
+            window.on_mouse_move(self._event(x, y))
+
+        @self.window.event
+        def on_mouse_drag(x, y, dx, dy, buttons, modifiers):
+            window.on_mouse_move(self._event(x, y))
+
+        @self.window.event
+        def on_key_press(symbol, modifiers):
+            if symbol == key.SPACE:
+                window.on_space_press(None)
+
+    def after(self, ms: int, callback) -> None:
+        self.pyglet.clock.schedule_once(lambda dt: callback(), ms / 1000)
+
+    def run(self) -> None:
+        self.pyglet.app.run()
+
+    def _create_static_items(self):
+        """Создает фигуры и надписи, которые живут все время игры."""
+        shapes = self.pyglet.shapes
+        text = self.pyglet.text
+
+        # Зона удаления
+        delete_x, delete_y, delete_width, delete_height = \
+            self.game.get_delete_zone_bounds()
+        self.delete_zone = shapes.BorderedRectangle(
+            delete_x, self._y(delete_y + delete_height),
+            delete_width, delete_height, border=2,
+            color=hex_to_rgb(DELETE_ZONE_COLOR), border_color=hex_to_rgb(RED),
+            batch=self.batch, group=self.background)
+        self.delete_label = text.Label(
+            "Удалить", x=delete_x + delete_width // 2,
+            y=self._y(delete_y + delete_height // 2),
+            anchor_x="center", anchor_y="center",
+            font_name="Arial", font_size=12, weight="bold",
+            color=hex_to_rgb(BLACK), batch=self.batch, group=self.overlay)
+
+        # Круг всасывания и индикатор его центра
+        self.suction_ring = shapes.Arc(
+            0, 0, self.game.suction_range, thickness=2,
+            color=hex_to_rgb(SUCTION_COLOR), batch=self.batch,
+            group=self.overlay)
+        self.suction_center = shapes.Circle(
+            0, 0, 5, color=hex_to_rgb(SUCTION_CENTER_COLOR),
+            batch=self.batch, group=self.overlay)
+        self.suction_ring.visible = False
+        self.suction_center.visible = False
+
+        # Количество шариков в инвентаре и на экране, инструкция
+        self.inventory_label = text.Label(
+            x=10, y=self._y(15), anchor_y="center",
+            font_name="Arial", font_size=12, color=hex_to_rgb(BLACK),
+            batch=self.batch, group=self.overlay)
+        self.balls_label = text.Label(
+            x=10, y=self._y(40), anchor_y="center",
+            font_name="Arial", font_size=12, color=hex_to_rgb(BLACK),
+            batch=self.batch, group=self.overlay)
+        self.instructions_label = text.Label(
+            INSTRUCTIONS, x=10, y=20, anchor_y="center",
+            font_name="Arial", font_size=10, color=hex_to_rgb(DARK_GRAY),
+            batch=self.batch, group=self.overlay)
+
+    def draw(self) -> None:
+        game = self.game
+        shapes = self.shapes
+        n = game.n
+
+        # Создаем недостающие фигуры и удаляем лишние
+        while len(shapes) < n:
+            outline = self.pyglet.shapes.Circle(
+                0, 0, 1, color=hex_to_rgb(BLACK),
+                batch=self.batch, group=self.outlines)
+            fill = self.pyglet.shapes.Circle(
+                0, 0, 1, batch=self.batch, group=self.fills)
+            shapes.append((outline, fill))
+        for outline, fill in shapes[n:]:
+            outline.delete()
+            fill.delete()
+        del shapes[n:]
+        if len(self.drawn_colors) != n:
+            self.drawn_colors = np.resize(self.drawn_colors, n)
+            self.drawn_colors[:] = -1
+
+        # Переносим позиции из массивов игровой логики
+        ys = game.screen_height - game.ys[:n]
+        for (outline, fill), x, y, radius in zip(shapes,
+                                                  game.xs[:n].tolist(),
+                                                  ys.tolist(),
+                                                  game.radii[:n].tolist()):
+            outline.position = fill.position = (x, y)
+            outline.radius = radius + 1
+            fill.radius = radius
+
+        # Перекрашиваем только шарики, чей цвет изменился
+        colors = game.colors[:n]
+        recolored = np.nonzero(colors != self.drawn_colors)[0]
+        for i, packed in zip(recolored.tolist(), colors[recolored].tolist()):
+            shapes[i][1].color = _rgb_color(packed)
+        self.drawn_colors[recolored] = colors[recolored]
+
+        # Визуализация всасывания
+        self.suction_ring.visible = game.suction_active
+        self.suction_center.visible = game.suction_active
+        if game.suction_active:
+            mouse_x, mouse_y = game.suction_mouse_pos
+            self.suction_ring.position = (mouse_x, self._y(mouse_y))
+            self.suction_center.position = (mouse_x, self._y(mouse_y))
+
+        # Счетчики (смена текста перестраивает надпись, поэтому только
+        # при изменении)
+        inventory_text = f"Инвентарь: {len(game.inventory)}" if game.inventory else ""
+        if self.inventory_label.text != inventory_text:
+            self.inventory_label.text = inventory_text
+        balls_text = f"Шариков: {n}"
+        if self.balls_label.text != balls_text:
+            self.balls_label.text = balls_text